@@ -1,15 +1,107 @@
 
 import pandas as pd
+import io
 import os
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+def _format_datetimes(df):
+    """Render datetime columns the way pandas' to_csv does (plain dates when all midnight)."""
+    out = None
+    for col in df.columns:
+        values = df[col]
+        if not pd.api.types.is_datetime64_any_dtype(values):
+            continue
+        present = values.dropna()
+        fmt = "%Y-%m-%d" if (present == present.dt.normalize()).all() else "%Y-%m-%d %H:%M:%S"
+        if out is None:
+            out = df.copy()
+        out[col] = values.dt.strftime(fmt)
+    return df if out is None else out
+
+def _write_csv(df, csv_path):
+    """Write df with PyArrow's columnar CSV writer, falling back to pandas.
+
+    Datetime columns are pre-formatted so both writers emit the same plain
+    dates (Arrow would otherwise write 'YYYY-MM-DD 00:00:00.000000000').
+    One difference remains: Arrow has no minimal quoting mode, so even with
+    quoting_style="needed" it quotes the header and every string field,
+    where pandas only quotes fields that need it. Any CSV reader (including
+    pd.read_csv) parses both the same way.
+    """
+    if PYARROW_AVAILABLE:
+        try:
+            table = pa.Table.from_pandas(_format_datetimes(df), preserve_index=False)
+            pacsv.write_csv(
+                table,
+                csv_path,
+                write_options=pacsv.WriteOptions(batch_size=8192, quoting_style="needed"),
+            )
+            return
+        except (pa.ArrowException, ValueError, TypeError) as e:
+            # Mixed-type object columns, or duplicate/NaN column names from a
+            # promoted header row, can't be converted - use the pandas writer
+            print(f"PyArrow CSV write failed, using pandas: {e}")
+    # The exports are small: render in memory, write once, then swap the file
+    # into place so a crash never leaves a half-written CSV behind
+    buf = io.StringIO()
+    df.to_csv(buf, index=False)
+    tmp_path = Path(f"{csv_path}.tmp")
+    tmp_path.write_text(buf.getvalue(), encoding="utf-8")
+    os.replace(tmp_path, csv_path)
+
+def _read_xlsx_streaming(xls_path):
+    """Read the active sheet of a ZIP-based workbook in read-only mode, or return None."""
+    with open(xls_path, "rb") as fh:
+        if fh.read(4) != b"PK\x03\x04":
+            return None
+    try:
+        from openpyxl import load_workbook
+        wb = load_workbook(xls_path, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            return pd.DataFrame(rows, columns=header)
+        finally:
+            wb.close()
+    except Exception as e3:
+        print(f"openpyxl read_only read failed: {e3}")
+        return None
+
+def _to_arrow_dtypes(df):
+    """Move object columns onto Arrow-backed dtypes so the writers work on Arrow buffers."""
+    if not PYARROW_AVAILABLE:
+        return df
+    try:
+        return df.convert_dtypes(dtype_backend="pyarrow")
+    except (TypeError, ValueError, pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # Mixed-type columns can't be inferred - cast only the object columns to strings
+        print(f"Arrow dtype conversion failed, casting object columns: {e}")
+        obj_cols = df.select_dtypes("object").columns
+        return df.astype({c: "string[pyarrow]" for c in obj_cols})
 
 def convert_xls_to_csv(xls_path, csv_path):
     print(f"Converting {xls_path} to {csv_path}...")
     try:
-        # Try reading with default engine (openpyxl for xlsx, xlrd for xls)
-        # Since these are .xls, we might need xlrd. 
+        # Prefer the Rust-backed calamine engine (single streaming pass over the
+        # workbook); fall back to the default engine (openpyxl for xlsx, xlrd for
+        # xls) when python-calamine is not installed (ImportError) or pandas is
+        # older than 2.2 and doesn't know the engine (ValueError).
         # Sometimes .xls files are actually HTML or XML.
         try:
-            df = pd.read_excel(xls_path)
+            try:
+                df = pd.read_excel(xls_path, engine="calamine")
+            except (ImportError, ValueError):
+                df = pd.read_excel(xls_path)
         except Exception as e:
             print(f"Standard read_excel failed: {e}")
             # Try reading as HTML (common for some exports)
@@ -18,31 +110,49 @@ def convert_xls_to_csv(xls_path, csv_path):
                 df = dfs[0]
             except Exception as e2:
                 print(f"HTML read failed: {e2}")
-                raise e
+                # Last resort for xlsx files saved with an .xls extension:
+                # stream the sheet with openpyxl's read-only mode
+                df = _read_xlsx_streaming(xls_path)
+                if df is None:
+                    raise e
         
         # Clean up header if needed (often row 1 is metadata)
         if 'Date' not in df.columns:
-            # Look for the row that contains "Date"
-            for i, row in df.iterrows():
-                if row.astype(str).str.contains('Date').any():
-                    print(f"Found header at row {i}")
-                    df.columns = df.iloc[i]
-                    df = df.iloc[i+1:]
-                    break
+            # Look for the first row that contains "Date" (one column-wise scan
+            # over the frame instead of building a Series per row)
+            hit = df.astype(str).apply(
+                lambda col: col.str.contains('Date', regex=False, na=False)
+            ).any(axis=1)
+            if hit.any():
+                i = int(hit.to_numpy().argmax())
+                print(f"Found header at row {i}")
+                df.columns = df.iloc[i]
+                df = df.iloc[i+1:].reset_index(drop=True)
         
-        df.to_csv(csv_path, index=False)
+        df = _to_arrow_dtypes(df)
+        _write_csv(df, csv_path)
         print(f"✓ Success: {csv_path}")
     except Exception as e:
         print(f"✗ Failed to convert {xls_path}: {e}")
 
-base_dir = "/Users/shtlpmac084/sh-hackathon/agentic-1/src/data/linkedin"
+def _convert_file(base_dir, f):
+    """Convert one export in base_dir to a .csv alongside it (picklable worker)."""
+    xls = os.path.join(base_dir, f)
+    csv = os.path.join(base_dir, f.replace(".xls", ".csv"))
+    convert_xls_to_csv(xls, csv)
+
+DEFAULT_BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "data", "linkedin")
 files = [
     "shorthills-ai_content_1766385907708 1.xls",
     "shorthills-ai_followers_1766385928211 1.xls", 
     "shorthills-ai_visitors_1766385917155 1.xls"
 ]
 
-for f in files:
-    xls = os.path.join(base_dir, f)
-    csv = os.path.join(base_dir, f.replace(".xls", ".csv"))
-    convert_xls_to_csv(xls, csv)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert LinkedIn .xls exports to .csv")
+    parser.add_argument("--base-dir", default=DEFAULT_BASE_DIR, help="Directory holding the .xls exports")
+    args = parser.parse_args()
+
+    # The files are independent, so convert them in separate processes
+    with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+        list(executor.map(partial(_convert_file, args.base_dir), files))
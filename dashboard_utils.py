@@ -1,7 +1,8 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
+from functools import lru_cache
+import zlib
 
 # --- Constants ---
 COLORS = {
@@ -69,9 +70,11 @@ def get_engagement_trend_data(months=6, platform="LinkedIn"):
     if platform == "Instagram": base = 5000
     if platform == "Website": base = 10000
 
+    # Seed from the inputs so the series is stable across reruns (and cache hits)
+    rng = np.random.default_rng(zlib.crc32(f"{platform}:{months}".encode()))
     data = {
-        "Month": [d.strftime("%b") for d in dates],
-        "Engagement Index": [int(base + x*400 + random.randrange(-500, 500)) for x in range(months)]
+        "Month": dates.strftime("%b"),
+        "Engagement Index": (base + np.arange(months) * 400 + rng.integers(-500, 500, size=months)).astype(np.int64)
     }
     return pd.DataFrame(data)
 
@@ -80,7 +83,7 @@ def get_supporting_charts_data():
     # Follower Growth (last 6 months small sparkline equivalent)
     dates = pd.date_range(end=datetime.today(), periods=6, freq='ME')
     df_followers = pd.DataFrame({
-        "Month": [d.strftime("%b") for d in dates],
+        "Month": dates.strftime("%b"),
         "Growth": [150, 180, 160, 210, 240, 250]
     })
     
@@ -140,22 +143,9 @@ def get_recommendations(platform="LinkedIn"):
 
 def get_report_summary():
     """Generates a text summary for the executive report."""
-    return (
-        "## 📑 Executive Summary Report\n\n"
-        "**Date:** " + datetime.today().strftime('%Y-%m-%d') + "\n\n"
-        "### 1. Overall Performance\n"
-        "Across all tracked channels (LinkedIn, Instagram, Website), The Insight Room has seen a **steady increase** in engagement "
-        "and visitor traffic. The **Video-First** content strategy is yielding significant results, particularly on Instagram and LinkedIn, "
-        "where engagement rates have outperformed benchmarks by **15-20%**.\n\n"
-        "### 2. Channel Highlights\n"
-        "- **LinkedIn:** Strong growth in the CTO/VP segment. Recommendation: Double down on thought leadership.\n"
-        "- **Instagram:** High traction on Reels. Recommendation: Increase posting frequency to daily.\n"
-        "- **Website:** Traffic up 12% MoM, largely driven by organic search. Recommendation: optimize landing pages for conversion.\n\n"
-        "### 3. Competitive Landscape\n"
-        "Competitor 'TechFlow' is aggressively targeting our core keywords. "
-        "We recommend an immediate counter-campaign focusing on 'Responsible AI' to maintain market leadership.\n\n"
-        "### 4. Next Steps\n"
-        "1. Approve the Q3 Video Budget.\n"
-        "2. Launch the 'AI Ethics' whitepaper series.\n"
-        "3. Review the paid ad strategy for the Executive Persona segment."
-    )
+    return _report_summary(datetime.today().strftime('%Y-%m-%d'))
+
+@lru_cache(maxsize=1)
+def _report_summary(date_str):
+    # Only the date varies, so the text is rebuilt at most once a day
+    return _REPORT_TMPL.format(date=date_str)
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from pydantic import BaseModel, Field
 
 class Platform(BaseModel):
@@ -99,6 +99,14 @@ class DataStore(BaseModel):
     instagram_profiles_reached: List[InstagramProfilesReached] = []
     competitors: List[str] = []
 
+    def record_counts(self) -> Dict[str, int]:
+        """Number of primary metric records loaded per platform"""
+        return {
+            "linkedin": len(self.linkedin_metrics),
+            "instagram": len(self.instagram_metrics),
+            "website": len(self.website_metrics),
+        }
+
 # ---- ADK Helper (Optional - only needed for ADK agents) ----
 try:
     import os
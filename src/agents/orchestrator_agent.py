@@ -49,7 +49,11 @@ class OrchestratorAgent:
         self.status_writer = status_writer  # Optional status writer for real-time updates
     
     def _log(self, message: str):
-        """Log message to both console and status writer if available"""
+        """Log message to both console and status writer if available.
+
+        The status writer streams into the UI from the script thread, so the
+        orchestrator must not be run inside a Streamlit-cached function.
+        """
         print(message)
         if self.status_writer:
             self.status_writer.write(message)
@@ -132,7 +136,8 @@ class OrchestratorAgent:
                             self._log(f"  ✗ {platform.capitalize()} ingestion failed: {error}")
                         else:
                             platform_stores[platform] = store
-                            self._log(f"  ✓ {platform.capitalize()} ingestion completed")
+                            n_records = len(getattr(store, f"{platform}_metrics", []))
+                            self._log(f"  ✓ {platform.capitalize()} ingestion completed ({n_records} records)")
                     except Exception as e:
                         platform = futures[future]
                         errors[platform] = str(e)
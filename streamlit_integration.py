@@ -7,10 +7,13 @@ Agent logic takes precedence - this file adapts agent outputs to UI
 import sys
 import os
 import threading
+from collections import deque
 from typing import List
 import hashlib
 import json
+import uuid
 import re
+import html
 sys.path.insert(0, os.path.dirname(__file__))
 
 from src.agents.orchestrator_agent import OrchestratorAgent
@@ -29,24 +32,37 @@ try:
 except ImportError:
     STREAMLIT_AVAILABLE = False
     # Create a dummy cache decorator for non-streamlit contexts
-    def cache_data(func):
+    # (supports both @st.cache_data and @st.cache_data(...))
+    def cache_data(func=None, **kwargs):
+        if func is None:
+            return lambda f: f
         return func
-    st = type('obj', (object,), {'cache_data': lambda f: f})()
+    st = type('obj', (object,), {'cache_data': staticmethod(cache_data)})()
+
+# Agent-derived views are keyed on the data hash, so the TTL only bounds memory
+CACHE_TTL = 3600
 
 def _get_data_hash(agent_data):
     """
     Generate a hash of the data to use as cache key.
     This ensures cache invalidates when data changes.
     """
-    if not agent_data or 'store' not in agent_data:
+    if not agent_data or not agent_data.get('store'):
         return "no_data"
     
+    # Computed once per ingestion by load_agent_data
+    if agent_data.get('data_hash'):
+        return agent_data['data_hash']
+    
     store = agent_data['store']
     # Create a simple hash based on record counts and latest dates
     data_signature = {
         'li_count': len(store.linkedin_metrics),
         'ig_count': len(store.instagram_metrics),
         'web_count': len(store.website_metrics),
+        # Unique per ingestion: a re-run can produce new LLM insights with the
+        # same counts and dates, and must not be served the old cached views
+        'run_id': agent_data.get('run_id'),
     }
     
     # Add latest dates for each platform to detect data updates
@@ -70,11 +86,30 @@ API_KEY = os.getenv("LITELLM_PROXY_GEMINI_API_KEY")
 # Global flag to prevent duplicate ingestion runs
 _INGESTION_LOCK = False
 
+def _has_script_context():
+    """True when called from a thread attached to a Streamlit script run"""
+    if not STREAMLIT_AVAILABLE:
+        return False
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return threading.current_thread() is threading.main_thread()
+    return get_script_run_ctx(suppress_warning=True) is not None
+
+# Most recent ingestion log lines kept by StreamlitStatusWriter
+LOG_MAX_LINES = 500
+
 class StreamlitStatusWriter:
-    """Writes status messages to Streamlit - accumulates messages for display"""
+    """Writes status messages to Streamlit - accumulates messages for display
+
+    Writes go live into the st.status container, so never hand a writer to an
+    st.cache_* function: Streamlit would record the writes and fail to replay
+    them into a container that belongs to an earlier run.
+    """
     def __init__(self, status_container):
         self.status_container = status_container
-        self.messages = []
+        # Bounded so a long ingestion run can't grow the log without limit
+        self.messages = deque(maxlen=LOG_MAX_LINES)
         self._is_main_thread = True  # Will be checked on first write
         # Write initial message
         self.write("🚀 Starting data ingestion process...")
@@ -83,13 +118,11 @@ class StreamlitStatusWriter:
         """Add a message to the log and write to status container (if in main thread)"""
         self.messages.append(message)
         
-        # Only try to write to Streamlit if we're in the main thread
+        # Only try to write to Streamlit from the script thread. Streamlit runs
+        # the script in its own (non-main) thread, so check for a script run
+        # context rather than the thread name - otherwise nothing streams live.
         # Worker threads from ThreadPoolExecutor don't have Streamlit context
-        current_thread = threading.current_thread()
-        is_main_thread = (current_thread.name == 'MainThread' or 
-                         isinstance(current_thread, threading._MainThread))
-        
-        if not is_main_thread:
+        if not _has_script_context():
             # In worker thread - just accumulate, don't try to write to Streamlit
             # This prevents the "missing ScriptRunContext" warning
             return
@@ -98,7 +131,7 @@ class StreamlitStatusWriter:
         try:
             if hasattr(self.status_container, 'write'):
                 # This is a st.status() context manager - write directly
-                # Note: Messages written here will appear when the context manager exits
+                # so each step shows up as soon as it is logged
                 self.status_container.write(message)
             # Also try to write using st.write if available (for debugging)
             # This won't work during blocking calls but helps with debugging
@@ -116,18 +149,12 @@ class StreamlitStatusWriter:
                 st.markdown("**Processing files and running agents...**")
                 st.markdown("---")
                 if self.messages:
-                    message_text = "\n".join(self.messages)
-                    st.text_area(
-                        "Progress Log:",
-                        value=message_text,
-                        height=min(400, max(200, len(self.messages) * 20)),
-                        disabled=True,
-                        label_visibility="visible"
-                    )
+                    st.markdown("Progress Log:")
+                    st.code("\n".join(self.messages), language=None)
     
     def clear(self):
         """Clear all messages"""
-        self.messages = []
+        self.messages.clear()
 
 def load_agent_data(status_writer=None):
     """
@@ -165,15 +192,23 @@ def load_agent_data(status_writer=None):
         orchestrator = OrchestratorAgent(base_dir, status_writer=status_writer)
         result = orchestrator.execute_all()
         
+        store = result.get('store')
+        
         # Return in same format as before (backward compatible)
-        return {
-            'store': result.get('store'),
+        agent_data = {
+            'store': store,
+            'record_counts': store.record_counts() if store else {},  # Counted once per ingestion
             'linkedin': result.get('linkedin', []),
             'instagram': result.get('instagram', []),
             'website': result.get('website', []),
             'executive': result.get('executive', []),
-            'execution_summary': result.get('execution_summary', {})  # New: execution metadata
+            'execution_summary': result.get('execution_summary', {}),  # New: execution metadata
+            'run_id': uuid.uuid4().hex  # Identifies this ingestion in the cache keys
         }
+        # Hash the store once here instead of rescanning every metric on each adapter call
+        if store:
+            agent_data['data_hash'] = _get_data_hash(agent_data)
+        return agent_data
     finally:
         _INGESTION_LOCK = False
 
@@ -186,25 +221,13 @@ def get_kpi_metrics_from_agent(platform_name, agent_data):
     data_hash = _get_data_hash(agent_data)
     return _get_kpi_metrics_with_hash(platform_name, agent_data, data_hash)
 
-def _get_kpi_metrics_with_hash(platform_name, agent_data, data_hash):
-    """Wrapper that uses hash for cache key"""
-    # Use hash as cache key, but pass full agent_data to computation
-    cache_key = f"kpi_{platform_name}_{data_hash}"
-    
-    if STREAMLIT_AVAILABLE:
-        # Check if we have a cached result
-        if not hasattr(st.session_state, '_kpi_cache'):
-            st.session_state._kpi_cache = {}
-        
-        if cache_key in st.session_state._kpi_cache:
-            return st.session_state._kpi_cache[cache_key]
-        
-        # Compute and cache
-        result = _get_kpi_metrics_uncached(platform_name, agent_data)
-        st.session_state._kpi_cache[cache_key] = result
-        return result
-    else:
-        return _get_kpi_metrics_uncached(platform_name, agent_data)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _get_kpi_metrics_with_hash(platform_name, _agent_data, data_hash):
+    """
+    Cached on (platform_name, data_hash) - shared across reruns and sessions.
+    The leading underscore keeps agent_data out of the cache key.
+    """
+    return _get_kpi_metrics_uncached(platform_name, _agent_data)
 
 def _get_sorted_metrics(store, platform_key):
     """
@@ -382,22 +405,17 @@ def get_insights_from_agent(platform_name, agent_data):
     data_hash = _get_data_hash(agent_data)
     return _get_insights_with_hash(platform_name, agent_data, data_hash)
 
-def _get_insights_with_hash(platform_name, agent_data, data_hash):
-    """Wrapper that uses hash for cache key"""
-    cache_key = f"insights_{platform_name}_{data_hash}"
-    
-    if STREAMLIT_AVAILABLE:
-        if not hasattr(st.session_state, '_insights_cache'):
-            st.session_state._insights_cache = {}
-        
-        if cache_key in st.session_state._insights_cache:
-            return st.session_state._insights_cache[cache_key]
-        
-        result = _get_insights_uncached(platform_name, agent_data)
-        st.session_state._insights_cache[cache_key] = result
-        return result
-    else:
-        return _get_insights_uncached(platform_name, agent_data)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _get_insights_with_hash(platform_name, _agent_data, data_hash):
+    """
+    Cached on (platform_name, data_hash) - shared across reruns and sessions.
+    The leading underscore keeps agent_data out of the cache key.
+    """
+    return _get_insights_uncached(platform_name, _agent_data)
+
+# Tag and whitespace patterns for _sanitize_html, compiled once at import
+_TAG_RE = re.compile(r'<[^>]*>?')
+_WS_RE = re.compile(r'\s+')
 
 def _sanitize_html(text: str) -> str:
     """Remove all HTML tags and clean up text"""
@@ -405,18 +423,13 @@ def _sanitize_html(text: str) -> str:
         return ""
     
     text = str(text)
-    # Remove all HTML tags (including multiline tags)
-    text = re.sub(r'<[^>]*>', '', text, flags=re.DOTALL)
-    # Remove any stray closing tags or fragments
-    text = re.sub(r'</[^>]*>', '', text)
-    # Remove incomplete opening tags at end
-    text = re.sub(r'<[^>]*$', '', text)
+    # Remove all HTML tags (opening, closing, multiline, and an incomplete one at the end)
+    text = _TAG_RE.sub('', text)
     # Clean up extra whitespace/newlines left by removed tags
-    text = re.sub(r'\s+', ' ', text)  # Replace multiple whitespace with single space
+    text = _WS_RE.sub(' ', text)  # Replace multiple whitespace with single space
     text = text.strip()
-    # Escape remaining special characters (do this last to avoid double-escaping)
-    text = text.replace('&amp;', '&')  # First unescape if already escaped
-    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    # Escape remaining special characters (unescape first to avoid double-escaping)
+    text = html.escape(html.unescape(text), quote=False)
     
     return text
 
@@ -471,22 +484,13 @@ def get_recommendations_from_agent(platform_name, agent_data):
     data_hash = _get_data_hash(agent_data)
     return _get_recommendations_with_hash(platform_name, agent_data, data_hash)
 
-def _get_recommendations_with_hash(platform_name, agent_data, data_hash):
-    """Wrapper that uses hash for cache key"""
-    cache_key = f"recommendations_{platform_name}_{data_hash}"
-    
-    if STREAMLIT_AVAILABLE:
-        if not hasattr(st.session_state, '_recommendations_cache'):
-            st.session_state._recommendations_cache = {}
-        
-        if cache_key in st.session_state._recommendations_cache:
-            return st.session_state._recommendations_cache[cache_key]
-        
-        result = _get_recommendations_uncached(platform_name, agent_data)
-        st.session_state._recommendations_cache[cache_key] = result
-        return result
-    else:
-        return _get_recommendations_uncached(platform_name, agent_data)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _get_recommendations_with_hash(platform_name, _agent_data, data_hash):
+    """
+    Cached on (platform_name, data_hash) - shared across reruns and sessions.
+    The leading underscore keeps agent_data out of the cache key.
+    """
+    return _get_recommendations_uncached(platform_name, _agent_data)
 
 def _get_recommendations_uncached(platform_name, agent_data):
     """Uncached version of recommendations extraction"""
@@ -573,26 +577,17 @@ def get_engagement_trend_data_from_agent(platform_name, agent_data):
     data_hash = _get_data_hash(agent_data)
     return _get_engagement_trend_with_hash(platform_name, agent_data, data_hash)
 
-def _get_engagement_trend_with_hash(platform_name, agent_data, data_hash):
-    """Wrapper that uses hash for cache key"""
-    cache_key = f"engagement_trend_{platform_name}_{data_hash}"
-    
-    if STREAMLIT_AVAILABLE:
-        if not hasattr(st.session_state, '_engagement_trend_cache'):
-            st.session_state._engagement_trend_cache = {}
-        
-        if cache_key in st.session_state._engagement_trend_cache:
-            return st.session_state._engagement_trend_cache[cache_key]
-        
-        result = _get_engagement_trend_uncached(platform_name, agent_data)
-        st.session_state._engagement_trend_cache[cache_key] = result
-        return result
-    else:
-        return _get_engagement_trend_uncached(platform_name, agent_data)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _get_engagement_trend_with_hash(platform_name, _agent_data, data_hash):
+    """
+    Cached on (platform_name, data_hash) - shared across reruns and sessions.
+    The leading underscore keeps agent_data out of the cache key.
+    """
+    return _get_engagement_trend_uncached(platform_name, _agent_data)
 
 def _get_engagement_trend_uncached(platform_name, agent_data):
     """Uncached version of engagement trend calculation"""
-    if not agent_data or 'store' not in agent_data:
+    if not agent_data or not agent_data.get('store'):
         return None
     
     platform_key = platform_name.lower()
@@ -661,11 +656,14 @@ def ask_insight_room(question: str, agent_data: dict) -> str:
     
     Returns:
         LLM-generated answer
+
+    Raises:
+        RuntimeError: if the LLM call fails (message truncated to 200 chars)
     """
     if not API_BASE or not API_KEY:
         return "LLM unavailable. Cannot answer questions."
     
-    if not agent_data or 'store' not in agent_data:
+    if not agent_data or not agent_data.get('store'):
         return "Please load data first using the 'Load Data' button in the sidebar."
     
     store = agent_data['store']
@@ -772,7 +770,9 @@ Answer:"""
         
         return response.choices[0].message.content.strip()
     except Exception as e:
-        return f"Error generating response: {str(e)[:200]}"
+        # Raise rather than return the error as an answer, so callers (and any
+        # cache in front of this function) can tell a failure from a reply
+        raise RuntimeError(str(e)[:200]) from e
 
 def get_supporting_charts_data_from_agent(agent_data):
     """
@@ -785,26 +785,17 @@ def get_supporting_charts_data_from_agent(agent_data):
     data_hash = _get_data_hash(agent_data)
     return _get_supporting_charts_with_hash(agent_data, data_hash)
 
-def _get_supporting_charts_with_hash(agent_data, data_hash):
-    """Wrapper that uses hash for cache key"""
-    cache_key = f"supporting_charts_{data_hash}"
-    
-    if STREAMLIT_AVAILABLE:
-        if not hasattr(st.session_state, '_supporting_charts_cache'):
-            st.session_state._supporting_charts_cache = {}
-        
-        if cache_key in st.session_state._supporting_charts_cache:
-            return st.session_state._supporting_charts_cache[cache_key]
-        
-        result = _get_supporting_charts_uncached(agent_data)
-        st.session_state._supporting_charts_cache[cache_key] = result
-        return result
-    else:
-        return _get_supporting_charts_uncached(agent_data)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _get_supporting_charts_with_hash(_agent_data, data_hash):
+    """
+    Cached on data_hash - shared across reruns and sessions.
+    The leading underscore keeps agent_data out of the cache key.
+    """
+    return _get_supporting_charts_uncached(_agent_data)
 
 def _get_supporting_charts_uncached(agent_data):
     """Uncached version of supporting charts calculation"""
-    if not agent_data or 'store' not in agent_data:
+    if not agent_data or not agent_data.get('store'):
         return None, None
     
     store = agent_data['store']